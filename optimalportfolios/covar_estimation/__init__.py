@@ -6,7 +6,8 @@ from optimalportfolios.covar_estimation.config import CovarEstimatorType
 
 from optimalportfolios.covar_estimation.ewma_covar_estimator import (EwmaCovarEstimator,
                                                                      estimate_current_ewma_covar,
-                                                                     estimate_rolling_ewma_covar)
+                                                                     estimate_rolling_ewma_covar,
+                                                                     estimate_rolling_ewma_covar_multi)
 
 from optimalportfolios.covar_estimation.factor_covar_data import (VarianceColumns,
                                                                   CurrentFactorCovarData,
@@ -14,13 +14,101 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 import qis as qis
-from typing import Optional, Dict
+from numba import njit
+from typing import Optional, Dict, List, Iterator, Tuple
 from dataclasses import dataclass
 
 from optimalportfolios.covar_estimation.covar_estimator import CovarEstimator
 from optimalportfolios.covar_estimation.utils import squeeze_covariance_matrix, compute_returns_from_prices
 
 
+@njit
+def update_ewm_covar(covar: np.ndarray, a: np.ndarray, ewm_lambda: float) -> None:
+    """
+    Apply the EWMA recursion S_t = λ S_{t-1} + (1-λ) r_t r_t' in place over the rows of a.
+
+    As in the BLAS symmetric rank-1 update (dsyr), only the lower triangle (j <= i) is
+    updated, halving the flops and memory writes; use ``symmetrise_lower`` to obtain
+    the full matrix. Entries involving an asset with a missing return are reset to
+    zero (same as qis.NanBackfill.ZERO_FILL), so assets joining or leaving the
+    universe are supported.
+
+    Args:
+        covar: Running covariance state (N x N), lower triangle updated in place.
+        a: Returns block (T x N) to ingest.
+        ewm_lambda: Decay factor λ = 1 - 2 / (span + 1).
+    """
+    n = covar.shape[0]
+    for t in range(a.shape[0]):
+        r = a[t]
+        is_valid = np.isfinite(r)
+        for i in range(n):
+            for j in range(i + 1):
+                if is_valid[i] and is_valid[j]:
+                    covar[i, j] = (1.0 - ewm_lambda) * r[i] * r[j] + ewm_lambda * covar[i, j]
+                else:
+                    covar[i, j] = 0.0
+
+
+@njit
+def update_ewm_covar_multi(covars: np.ndarray, a: np.ndarray, ewm_lambdas: np.ndarray) -> None:
+    """
+    Apply the EWMA recursion for K spans in a single pass over time.
+
+    At each period the K running covariances are updated one after another, so the
+    returns of that period are read once while they are hot in cache.
+
+    Args:
+        covars: Running covariance states (K x N x N), lower triangles updated in place.
+        a: Returns blocks (K x T x N); a[k] are the returns used for span k
+            (they differ only when returns are demeaned with a span-dependent mean).
+            A single block (1 x T x N) is shared by all spans.
+        ewm_lambdas: Decay factors (K,).
+    """
+    is_shared = a.shape[0] == 1
+    for t in range(a.shape[1]):
+        for k in range(covars.shape[0]):
+            a_k = a[0] if is_shared else a[k]
+            update_ewm_covar(covars[k], a_k[t:t + 1], ewm_lambdas[k])
+
+
+def symmetrise_lower(covar: np.ndarray) -> np.ndarray:
+    """
+    Build the full symmetric matrix from the lower triangle of covar.
+    """
+    lower = np.tril(covar)
+    return lower + np.tril(covar, -1).T
+
+
+def iter_ewm_covar_snapshots(x: np.ndarray,
+                             span: int,
+                             snapshot_indices: List[int]
+                             ) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Iterate EWMA covariance matrices at the given row indices of the returns array.
+
+    The running covariance is carried across snapshots, so each step ingests only the
+    returns since the previous snapshot. Memory is O(N²) instead of the O(T·N²) of
+    the full covariance tensor.
+
+    Args:
+        x: Returns array (T x N), may contain NaNs.
+        span: EWMA span in periods.
+        snapshot_indices: Increasing row indices at which to emit the covariance.
+
+    Yields:
+        Tuples of (row index, covariance matrix (N x N) copy).
+    """
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    ewm_lambda = 1.0 - 2.0 / (span + 1.0)
+    covar = np.zeros((x.shape[1], x.shape[1]))
+    last_idx = 0
+    for idx in snapshot_indices:
+        update_ewm_covar(covar, x[last_idx:idx + 1], ewm_lambda)
+        last_idx = idx + 1
+        yield idx, symmetrise_lower(covar)
+
+
 def estimate_current_ewma_covar(prices: pd.DataFrame,
                                 returns_freq: str = 'W-WED',
                                 span: int = 52,
@@ -53,11 +141,10 @@ def estimate_current_ewma_covar(prices: pd.DataFrame,
     if is_apply_vol_normalised_returns:
         covar_tensor_txy, _, _ = qis.compute_ewm_covar_tensor_vol_norm_returns(
             a=x, span=span, nan_backfill=qis.NanBackfill.ZERO_FILL)
+        covar_t = covar_tensor_txy[-1]
     else:
-        covar_tensor_txy = qis.compute_ewm_covar_tensor(
-            a=x, span=span, nan_backfill=qis.NanBackfill.ZERO_FILL)
+        _, covar_t = next(iter_ewm_covar_snapshots(x=x, span=span, snapshot_indices=[x.shape[0] - 1]))
 
-    covar_t = covar_tensor_txy[-1]
     if squeeze_factor is not None:
         covar_t = squeeze_covariance_matrix(covar=covar_t, squeeze_factor=squeeze_factor)
     if apply_an_factor:
@@ -126,8 +213,9 @@ class EwmaCovarEstimator(CovarEstimator):
         """
         Compute rolling EWMA covariance matrices at each rebalancing date.
 
-        Computes the full EWMA covariance tensor in a single O(T) pass,
-        then extracts slices at each rebalancing date within the time period.
+        Runs the EWMA recursion in a single O(T) pass, carrying the covariance
+        state between rebalancing dates and keeping only the matrices at each
+        rebalancing date within the time period.
 
         Args:
             prices: Asset price panel. Index=dates, columns=tickers.
@@ -145,13 +233,6 @@ class EwmaCovarEstimator(CovarEstimator):
                                               span=self.span)
         x = returns.to_numpy()
 
-        if self.is_apply_vol_normalised_returns:
-            covar_tensor, _, _ = qis.compute_ewm_covar_tensor_vol_norm_returns(
-                a=x, span=self.span, nan_backfill=qis.NanBackfill.ZERO_FILL)
-        else:
-            covar_tensor = qis.compute_ewm_covar_tensor(
-                a=x, span=self.span, nan_backfill=qis.NanBackfill.ZERO_FILL)
-
         # rebalancing indicator aligned to returns index
         rebalancing_schedule = qis.generate_rebalancing_indicators(df=returns, freq=freq)
         if np.all(rebalancing_schedule == False):
@@ -163,14 +244,21 @@ class EwmaCovarEstimator(CovarEstimator):
         tickers = prices.columns.to_list()
         an_factor = qis.infer_annualisation_factor_from_df(data=returns)
         start_date = time_period.start.tz_localize(tz=returns.index.tz)
+        rebalancing_indices = [idx for idx, (date, is_rebal) in enumerate(rebalancing_schedule.items())
+                               if is_rebal and date >= start_date]
+
+        if self.is_apply_vol_normalised_returns:
+            covar_tensor, _, _ = qis.compute_ewm_covar_tensor_vol_norm_returns(
+                a=x, span=self.span, nan_backfill=qis.NanBackfill.ZERO_FILL)
+            covar_snapshots = ((idx, covar_tensor[idx]) for idx in rebalancing_indices)
+        else:
+            covar_snapshots = iter_ewm_covar_snapshots(x=x, span=self.span, snapshot_indices=rebalancing_indices)
 
         covars: Dict[pd.Timestamp, pd.DataFrame] = {}
-        for idx, (date, is_rebal) in enumerate(rebalancing_schedule.items()):
-            if is_rebal and date >= start_date:
-                covar_t = covar_tensor[idx]
-                if self.squeeze_factor is not None:
-                    covar_t = squeeze_covariance_matrix(covar=covar_t, squeeze_factor=self.squeeze_factor)
-                covars[date] = pd.DataFrame(an_factor * covar_t, index=tickers, columns=tickers)
+        for idx, covar_t in covar_snapshots:
+            if self.squeeze_factor is not None:
+                covar_t = squeeze_covariance_matrix(covar=covar_t, squeeze_factor=self.squeeze_factor)
+            covars[rebalancing_schedule.index[idx]] = pd.DataFrame(an_factor * covar_t, index=tickers, columns=tickers)
 
         return covars
 
@@ -192,28 +280,88 @@ def estimate_rolling_ewma_covar(prices: pd.DataFrame,
     """
     returns = compute_returns_from_prices(prices=prices, returns_freq=returns_freq, demean=demean, span=span)
     x = returns.to_numpy()
+
+    # create rebalancing schedule
+    rebalancing_schedule = qis.generate_rebalancing_indicators(df=returns, freq=rebalancing_freq)
+    if np.all(rebalancing_schedule == False):
+        raise ValueError(f"rebalancing shedule is empty for return period {qis.get_time_period(df=returns).to_str()} "
+                         f"and rebalancing_freq={rebalancing_freq}")
+
+    tickers = prices.columns.to_list()
+    covars = {}
+    if apply_an_factor:
+        an_factor = qis.infer_annualisation_factor_from_df(data=returns)
+    else:
+        an_factor = 1.0
+    start_date = time_period.start.tz_localize(tz=returns.index.tz)  # make sure tz is alined with rebalancing_schedule
+    rebalancing_indices = [idx for idx, (date, value) in enumerate(rebalancing_schedule.items())
+                           if value and date >= start_date]
+
+    # only covars at rebalancing dates are kept, the ewma state is carried between them
     if is_apply_vol_normalised_returns:
         covar_tensor_txy, _, _ = qis.compute_ewm_covar_tensor_vol_norm_returns(a=x, span=span, nan_backfill=qis.NanBackfill.ZERO_FILL)
+        covar_snapshots = ((idx, covar_tensor_txy[idx]) for idx in rebalancing_indices)
     else:
-        covar_tensor_txy = qis.compute_ewm_covar_tensor(a=x, span=span, nan_backfill=qis.NanBackfill.ZERO_FILL)
+        covar_snapshots = iter_ewm_covar_snapshots(x=x, span=span, snapshot_indices=rebalancing_indices)
 
-    # create rebalancing schedule
+    for idx, covar_np in covar_snapshots:
+        covar_t = pd.DataFrame(covar_np, index=tickers, columns=tickers)
+        if squeeze_factor is not None:
+            covar_t = squeeze_covariance_matrix(covar=covar_t, squeeze_factor=squeeze_factor)
+        covars[rebalancing_schedule.index[idx]] = an_factor*covar_t
+    return covars
+
+
+def estimate_rolling_ewma_covar_multi(prices: pd.DataFrame,
+                                      time_period: qis.TimePeriod,  # when we start building portfolios
+                                      spans: List[int],
+                                      returns_freq: str = 'W-WED',
+                                      rebalancing_freq: str = 'QE',
+                                      demean: bool = True,
+                                      squeeze_factor: Optional[float] = None,
+                                      apply_an_factor: bool = True
+                                      ) -> Dict[int, Dict[pd.Timestamp, pd.DataFrame]]:
+    """
+    compute ewma covar matrices for several spans in one pass over returns
+    equivalent to calling estimate_rolling_ewma_covar for each span (without vol-normalised returns)
+    output is dict[span, dict[estimation timestamp, pd.Dataframe(estimated_covar)]]
+    """
+    if len(set(spans)) != len(spans):
+        raise ValueError(f"spans must be unique, given spans={spans}")
+    if demean:
+        returns_by_span = [compute_returns_from_prices(prices=prices, returns_freq=returns_freq, demean=demean, span=span)
+                           for span in spans]
+    else:  # returns do not depend on span, a single block is shared by all spans
+        returns_by_span = [compute_returns_from_prices(prices=prices, returns_freq=returns_freq, demean=demean,
+                                                       span=spans[0])]
+    returns = returns_by_span[0]
+    x = np.ascontiguousarray(np.stack([returns_.to_numpy() for returns_ in returns_by_span]), dtype=np.float64)
+
+    # create rebalancing schedule, returns index is the same for all spans
     rebalancing_schedule = qis.generate_rebalancing_indicators(df=returns, freq=rebalancing_freq)
     if np.all(rebalancing_schedule == False):
         raise ValueError(f"rebalancing shedule is empty for return period {qis.get_time_period(df=returns).to_str()} "
                          f"and rebalancing_freq={rebalancing_freq}")
 
     tickers = prices.columns.to_list()
-    covars = {}
     if apply_an_factor:
         an_factor = qis.infer_annualisation_factor_from_df(data=returns)
     else:
         an_factor = 1.0
     start_date = time_period.start.tz_localize(tz=returns.index.tz)  # make sure tz is alined with rebalancing_schedule
-    for idx, (date, value) in enumerate(rebalancing_schedule.items()):
-        if value and date >= start_date:
-            covar_t = pd.DataFrame(covar_tensor_txy[idx], index=tickers, columns=tickers)
+    rebalancing_indices = [idx for idx, (date, value) in enumerate(rebalancing_schedule.items())
+                           if value and date >= start_date]
+
+    ewm_lambdas = np.array([1.0 - 2.0 / (span + 1.0) for span in spans])
+    covars_k = np.zeros((len(spans), x.shape[2], x.shape[2]))
+    covars = {span: {} for span in spans}
+    last_idx = 0
+    for idx in rebalancing_indices:
+        update_ewm_covar_multi(covars_k, x[:, last_idx:idx + 1], ewm_lambdas)
+        last_idx = idx + 1
+        for k, span in enumerate(spans):
+            covar_t = pd.DataFrame(symmetrise_lower(covars_k[k]), index=tickers, columns=tickers)
             if squeeze_factor is not None:
                 covar_t = squeeze_covariance_matrix(covar=covar_t, squeeze_factor=squeeze_factor)
-            covars[date] = an_factor*covar_t
+            covars[span][rebalancing_schedule.index[idx]] = an_factor*covar_t
     return covars
@@ -1,9 +1,11 @@
 """
 Tests for EwmaCovarEstimator.
 
-Two test cases verifying:
+Four test cases verifying:
 1. Internal consistency: fit_current_covar matches the last matrix from fit_rolling_covars
 2. Rolling output properties: PSD, shape, annualised vol range, rebalancing schedule
+3. Incremental EWMA snapshots match the full qis EWMA covariance tensor
+4. Multi-span single-pass estimation matches per-span estimation
 """
 import numpy as np
 import pandas as pd
@@ -11,12 +13,18 @@ import matplotlib.pyplot as plt
 from enum import Enum
 import qis as qis
 
-from optimalportfolios.covar_estimation.ewma_covar_estimator import EwmaCovarEstimator
+from optimalportfolios.covar_estimation.ewma_covar_estimator import (EwmaCovarEstimator,
+                                                                     iter_ewm_covar_snapshots,
+                                                                     estimate_rolling_ewma_covar,
+                                                                     estimate_rolling_ewma_covar_multi)
+from optimalportfolios.covar_estimation.utils import compute_returns_from_prices
 
 
 class LocalTests(Enum):
     CURRENT_VS_ROLLING_LAST = 1
     ROLLING_COVAR_PROPERTIES = 2
+    INCREMENTAL_VS_TENSOR = 3
+    MULTI_SPAN_VS_SINGLE = 4
 
 
 def run_local_test(local_test: LocalTests):
@@ -206,6 +214,52 @@ def run_local_test(local_test: LocalTests):
                              legend_stats=qis.LegendStats.FIRST_AVG_LAST,
                              ax=axs[1])
 
+    elif local_test == LocalTests.INCREMENTAL_VS_TENSOR:
+        """
+        Verify that the incremental EWMA recursion, which carries the covariance
+        state between rebalancing dates, reproduces the slices of the full
+        qis EWMA covariance tensor. The first asset is masked before 2010
+        to exercise NaN handling for assets joining the universe.
+        """
+        prices_nan = prices.copy()
+        prices_nan.loc[:'2010', tickers[0]] = np.nan
+        returns = compute_returns_from_prices(prices=prices_nan, returns_freq='W-WED', demean=True, span=52)
+        x = returns.to_numpy()
+        covar_tensor = qis.compute_ewm_covar_tensor(a=x, span=52, nan_backfill=qis.NanBackfill.ZERO_FILL)
+
+        rebalancing_schedule = qis.generate_rebalancing_indicators(df=returns, freq='QE')
+        rebalancing_indices = list(np.flatnonzero(rebalancing_schedule.to_numpy()))
+
+        max_diff = 0.0
+        for idx, covar_t in iter_ewm_covar_snapshots(x=x, span=52, snapshot_indices=rebalancing_indices):
+            max_diff = max(max_diff, np.abs(covar_t - covar_tensor[idx]).max())
+
+        print(f"── Incremental vs Tensor ──")
+        print(f"Num snapshots:      {len(rebalancing_indices)}")
+        print(f"Max abs covar diff: {max_diff:.2e}")
+        print(f"\nRESULT: {'MATCH' if max_diff < 1e-12 else 'MISMATCH — investigate'}")
+
+    elif local_test == LocalTests.MULTI_SPAN_VS_SINGLE:
+        """
+        Verify that estimate_rolling_ewma_covar_multi, which updates the covariances
+        of all spans in one pass over returns, reproduces estimate_rolling_ewma_covar
+        run separately for each span.
+        """
+        spans = [5, 13, 26, 52, 104]
+        time_period = qis.TimePeriod('31Dec2004', prices.index[-1])
+        covars_multi = estimate_rolling_ewma_covar_multi(prices=prices, time_period=time_period, spans=spans)
+
+        print(f"── Multi-span vs Single-span ──")
+        max_diff = 0.0
+        for span in spans:
+            covars_single = estimate_rolling_ewma_covar(prices=prices, time_period=time_period, span=span)
+            assert list(covars_single.keys()) == list(covars_multi[span].keys())
+            diff = max(np.abs(covars_single[date].values - covars_multi[span][date].values).max()
+                       for date in covars_single.keys())
+            print(f"span={span:>3}: num dates={len(covars_single)}, max abs covar diff={diff:.2e}")
+            max_diff = max(max_diff, diff)
+        print(f"\nRESULT: {'MATCH' if max_diff < 1e-12 else 'MISMATCH — investigate'}")
+
     plt.show()
 
 
@@ -4,29 +4,54 @@ backtest parameter sensitivity of one method
 # imports
 import pandas as pd
 import matplotlib.pyplot as plt
-from typing import List
+from typing import List, Dict
 from enum import Enum
 import qis as qis
+from joblib import Parallel, delayed
 
 # package
 from optimalportfolios import (PortfolioObjective, backtest_rolling_optimal_portfolio,
                                Constraints, GroupLowerUpperConstraints,
-                               EwmaCovarEstimator)
+                               estimate_rolling_ewma_covar_multi)
 from optimalportfolios.examples.universe import fetch_benchmark_universe_data
 
 
+def backtest_max_diversification_for_span(prices: pd.DataFrame,
+                                           constraints: Constraints,
+                                           covar_dict: Dict[pd.Timestamp, pd.DataFrame],
+                                           ticker: str,
+                                           returns_freq: str = 'W-WED'
+                                           ) -> qis.PortfolioData:
+    """
+    backtest maximum diversification portfolio for covariances estimated with one span
+    defined at module level so it can be pickled by joblib workers
+    """
+    portfolio_data = backtest_rolling_optimal_portfolio(prices=prices,
+                                                        constraints=constraints,
+                                                        portfolio_objective=PortfolioObjective.MAX_DIVERSIFICATION,
+                                                        returns_freq=returns_freq,
+                                                        covar_dict=covar_dict,
+                                                        ticker=f"span-{ticker}",  # portfolio id
+                                                        rebalancing_costs=0.0010,  # 10bp for rebalancin
+                                                        weight_implementation_lag=1
+                                                        )
+    return portfolio_data
+
+
 def run_max_diversification_sensitivity_to_span(prices: pd.DataFrame,
                                                 benchmark_prices: pd.DataFrame,
                                                 group_data: pd.Series,
                                                 time_period: qis.TimePeriod,  # weight computations
                                                 perf_time_period: qis.TimePeriod,  # for reporting
-                                                constraints: Constraints
+                                                constraints: Constraints,
+                                                n_jobs: int = -1
                                                 ) -> List[plt.Figure]:
     """
     test maximum diversification optimiser to span parameter
     span is number period for ewm filter
     span = 20 for daily universe implies last 20 (trading) days contribute 50% of weight for covariance estimation
     we test sensitivity from fast (small span) to slow (large span)
+    backtests for different spans are independent and run in parallel with joblib using n_jobs workers
     """
     # use daily returns
     returns_freq = 'W-WED'  # returns freq
@@ -34,22 +59,23 @@ def run_max_diversification_sensitivity_to_span(prices: pd.DataFrame,
     # for weekly returns assume 5 weeeks per month
     spans = {'1m': 5, '3m': 13, '6m': 26, '1y': 52, '2y': 104}
 
-    # now create a list of portfolios
-    portfolio_datas = []
-    for ticker, span in spans.items():
-        ewma_estimator = EwmaCovarEstimator(returns_freq=returns_freq, span=span, rebalancing_freq='QE')
-        covar_dict = ewma_estimator.fit_rolling_covars(prices=prices, time_period=time_period)
-        portfolio_data = backtest_rolling_optimal_portfolio(prices=prices,
-                                                            constraints=constraints,
-                                                            portfolio_objective=PortfolioObjective.MAX_DIVERSIFICATION,
-                                                            returns_freq=returns_freq,
-                                                            covar_dict=covar_dict,
-                                                            ticker=f"span-{ticker}",  # portfolio id
-                                                            rebalancing_costs=0.0010,  # 10bp for rebalancin
-                                                            weight_implementation_lag=1
-                                                            )
+    # estimate ewma covariances of all spans in one pass over returns
+    covar_dicts = estimate_rolling_ewma_covar_multi(prices=prices,
+                                                    time_period=time_period,
+                                                    spans=list(spans.values()),
+                                                    returns_freq=returns_freq,
+                                                    rebalancing_freq='QE')
+
+    # now create a list of portfolios, one backtest per span
+    portfolio_datas = Parallel(n_jobs=n_jobs, backend='loky')(
+        delayed(backtest_max_diversification_for_span)(prices=prices,
+                                                       constraints=constraints,
+                                                       covar_dict=covar_dicts[span],
+                                                       ticker=ticker,
+                                                       returns_freq=returns_freq)
+        for ticker, span in spans.items())
+    for portfolio_data in portfolio_datas:
         portfolio_data.set_group_data(group_data=group_data)
-        portfolio_datas.append(portfolio_data)
 
     # run cross portfolio report
     multi_portfolio_data = qis.MultiPortfolioData(portfolio_datas=portfolio_datas, benchmark_prices=benchmark_prices)
@@ -126,9 +126,13 @@ def run_example():
     #    requires increasing the hedge weight substantially — against the
     #    local gradient direction.
     #
+    # use_ccd=False skips the coordinate descent first pass so that the
+    # SSE formulation is solved by SLSQP directly.
+    #
     w_scipy = opt_risk_budgeting_scipy(covar=covar,
                                        constraints=constraints,
-                                       risk_budget=risk_budget)
+                                       risk_budget=risk_budget,
+                                       use_ccd=False)
     print_solution("Scipy SLSQP (local solver, non-convex formulation)",
                    w_scipy, covar, risk_budget, tickers)
 
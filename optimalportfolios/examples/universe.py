@@ -11,11 +11,15 @@ from typing import Tuple
 from enum import Enum
 
 
-def fetch_benchmark_universe_data() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.Series, pd.Series, pd.DataFrame]:
+def fetch_benchmark_universe_data(freq: str = 'B'
+                                  ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.Series, pd.Series, pd.DataFrame]:
     """
     fetch a universe of etfs
     define custom universe with asset class grouping
     5 asset groups with 3 etfs in each
+    freq is the frequency of output prices: 'B' for business days,
+    or a lower frequency e.g. 'W-WED' for callers using only weekly returns and weekly backtests
+    prices are downsampled before forward-filling so the business day grid is not materialised
     """
     universe_data = dict(SPY='Equities',
                          QQQ='Equities',
@@ -42,7 +46,10 @@ def fetch_benchmark_universe_data() -> Tuple[pd.DataFrame, pd.DataFrame, pd.Data
     tickers = list(universe_data.keys())
     benchmark_weights = pd.Series(benchmark_weights)
     prices = yf.download(tickers=tickers, start="2003-12-31", end=None, ignore_tz=True, auto_adjust=True)['Close'][tickers]
-    prices = prices.asfreq('B').ffill()
+    if freq == 'B':
+        prices = prices.asfreq('B').ffill()
+    else:
+        prices = prices.resample(freq).last().ffill()
     # for group lass
     ac_benchmark_prices = prices[['SPY', 'TLT', 'LQD', 'HYG', 'GSG']].rename(dict(SPY='Equities', TLT='Bonds', IG='LQD', HYG='HighYield', GLD='Commodts'))
 
@@ -1002,6 +1002,7 @@ class Constraints:
         """Generate SciPy-compatible constraints (inequality form: constraint >= 0).
 
         Converts constraints to format expected by scipy.optimize.minimize.
+        Combines set_static_scipy_constraints() and set_covar_dependent_scipy_constraints().
 
         Args:
             covar: Covariance matrix (used for bounds inference if needed).
@@ -1009,6 +1010,20 @@ class Constraints:
         Returns:
             Tuple of (constraint dictionaries, bounds array).
         """
+        covar_constraints, bounds = self.set_covar_dependent_scipy_constraints(covar=covar)
+        constraints = self.set_static_scipy_constraints() + covar_constraints
+        return constraints, bounds
+
+    def set_static_scipy_constraints(self) -> List:
+        """Generate SciPy-compatible constraints that do not depend on the covariance matrix.
+
+        Covers long-only, total exposure and group allocation constraints. The list is
+        identical across rebalancing dates with the same valid tickers, so rolling
+        solvers can build it once and reuse it.
+
+        Returns:
+            List of constraint dictionaries.
+        """
         constraints = []
 
         if self.is_long_only and self.min_weights is None:
@@ -1032,7 +1047,21 @@ class Constraints:
                         if not np.isnan(max_weight):
                             constraints += [{'type': 'ineq',
                                              'fun': make_max_constraint(group_loading, max_weight)}]
+        return constraints
+
+    def set_covar_dependent_scipy_constraints(self, covar: np.ndarray) -> Tuple[List, np.ndarray]:
+        """Generate SciPy-compatible constraints that must be rebuilt for each covariance matrix.
 
+        No scipy constraint currently depends on the covariance values, so the list is
+        empty; bounds are returned here because their size follows the covariance matrix.
+
+        Args:
+            covar: Covariance matrix (used for bounds inference if needed).
+
+        Returns:
+            Tuple of (constraint dictionaries, bounds array).
+        """
+        constraints = []
         bounds = self.set_scipy_bounds(covar=covar)
         return constraints, bounds
 
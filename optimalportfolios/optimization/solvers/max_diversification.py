@@ -32,7 +32,7 @@ import warnings
 import numpy as np
 import pandas as pd
 from scipy.optimize import minimize
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 # optimalportfolios
 from optimalportfolios.utils.portfolio_funcs import calculate_diversification_ratio
@@ -68,23 +68,29 @@ def rolling_maximise_diversification(prices: pd.DataFrame,
         DataFrame of portfolio weights. Index=rebalancing dates,
         columns=tickers aligned to ``prices.columns``.
     """
-    weights = {}
+    # rows are written into a preallocated array aligned to prices.columns, assets missing from covar are NaN
+    tickers = prices.columns
+    weights = np.full((len(covar_dict), len(tickers)), np.nan)
     weights_0 = None
-    for date, pd_covar in covar_dict.items():
+    static_constraints_cache = {}  # scipy constraints not depending on covar, keyed by valid tickers
+    for idx, (date, pd_covar) in enumerate(covar_dict.items()):
         weights_ = wrapper_maximise_diversification(pd_covar=pd_covar,
                                                     constraints=constraints,
-                                                    weights_0=weights_0)
+                                                    weights_0=weights_0,
+                                                    static_constraints_cache=static_constraints_cache)
         weights_0 = weights_
-        weights[date] = weights_
+        positions = tickers.get_indexer(weights_.index)
+        is_in_prices = positions >= 0
+        weights[idx, positions[is_in_prices]] = weights_.to_numpy()[is_in_prices]
 
-    weights = pd.DataFrame.from_dict(weights, orient='index')
-    weights = weights.reindex(columns=prices.columns.to_list())
+    weights = pd.DataFrame(weights, index=list(covar_dict.keys()), columns=tickers.to_list())
     return weights
 
 
 def wrapper_maximise_diversification(pd_covar: pd.DataFrame,
                                      constraints: Constraints,
-                                     weights_0: pd.Series = None
+                                     weights_0: pd.Series = None,
+                                     static_constraints_cache: Optional[Dict[Tuple[str, ...], List[Dict]]] = None
                                      ) -> pd.Series:
     """
     Single-date maximum diversification with NaN/zero-variance filtering.
@@ -97,6 +103,8 @@ def wrapper_maximise_diversification(pd_covar: pd.DataFrame,
         pd_covar: Covariance matrix (N x N) as DataFrame.
         constraints: Portfolio constraints.
         weights_0: Previous-period weights for warm-start / fallback.
+        static_constraints_cache: Optional dict, shared across rebalancing dates, of
+            ``Constraints.set_static_scipy_constraints()`` keyed by the valid tickers.
 
     Returns:
         Portfolio weights as pd.Series aligned to pd_covar.index.
@@ -108,8 +116,17 @@ def wrapper_maximise_diversification(pd_covar: pd.DataFrame,
                                                          total_to_good_ratio=len(pd_covar.columns) / len(clean_covar.columns),
                                                          weights_0=weights_0)
 
+    if static_constraints_cache is not None:
+        valid_tickers = tuple(clean_covar.columns)
+        if valid_tickers not in static_constraints_cache:
+            static_constraints_cache[valid_tickers] = constraints1.set_static_scipy_constraints()
+        static_constraints = static_constraints_cache[valid_tickers]
+    else:
+        static_constraints = None
+
     weights = opt_maximise_diversification(covar=clean_covar.to_numpy(),
-                                           constraints=constraints1)
+                                           constraints=constraints1,
+                                           static_constraints=static_constraints)
     weights = pd.Series(weights, index=clean_covar.columns)
     weights = weights.reindex(index=pd_covar.columns).fillna(0.0)
     return weights
@@ -119,7 +136,8 @@ def opt_maximise_diversification(covar: np.ndarray,
                                  constraints: Constraints,
                                  verbose: bool = False,
                                  ftol: float = 1e-8,
-                                 maxiter: int = 500
+                                 maxiter: int = 500,
+                                 static_constraints: Optional[List[Dict]] = None
                                  ) -> np.ndarray:
     """
     Maximise the diversification ratio via scipy SLSQP.
@@ -138,6 +156,8 @@ def opt_maximise_diversification(covar: np.ndarray,
         verbose: If True, print SLSQP solver diagnostics.
         ftol: Function tolerance for convergence.
         maxiter: Maximum number of SLSQP iterations.
+        static_constraints: Precomputed ``constraints.set_static_scipy_constraints()``;
+            if given, only the covariance-dependent constraints are rebuilt.
 
     Returns:
         Optimal weights (N,). Falls back to weights_0 or zeros if the
@@ -147,7 +167,11 @@ def opt_maximise_diversification(covar: np.ndarray,
     n = covar.shape[0]
     x0 = np.ones(n) / n
 
-    constraints_, bounds = constraints.set_scipy_constraints(covar=covar)
+    if static_constraints is None:
+        constraints_, bounds = constraints.set_scipy_constraints(covar=covar)
+    else:
+        covar_constraints, bounds = constraints.set_covar_dependent_scipy_constraints(covar=covar)
+        constraints_ = static_constraints + covar_constraints
     res = minimize(max_diversification_objective, x0, args=[covar], method='SLSQP',
                    constraints=constraints_,
                    bounds=bounds,
@@ -12,8 +12,11 @@ the risk contribution of each asset is proportional to its budget, subject
 to portfolio constraints (long-only, weight bounds, group exposures).
 
 The primary solver uses ``ConstrainedRiskBudgeting`` from the pyrb package,
-which supports linear inequality constraints on the weights. A scipy SLSQP
-fallback is also provided but not recommended for production use.
+which supports linear inequality constraints on the weights. A scipy-based
+fallback is also provided: it first solves the convex Spinu (2013) problem by
+cyclical coordinate descent (or, if it does not converge, by an interior-point
+solve of the log-barrier formulation with CVXPY) and resorts to SLSQP only when
+the solution violates the constraints.
 
 Special features:
     - Rebalancing indicators: assets can be frozen at previous weights while
@@ -34,15 +37,17 @@ from __future__ import division
 
 import warnings
 import numpy as np
+from dataclasses import replace
 import pandas as pd
 import qis as qis
+import cvxpy as cvx
+from numba import njit, prange
+from scipy.linalg import cholesky, LinAlgError
 from scipy.optimize import minimize
-from typing import Dict, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
-from optimalportfolios.utils.portfolio_funcs import (compute_portfolio_variance,
-                                                     compute_portfolio_risk_contributions,
-                                                     compute_portfolio_risk_contribution_outputs)
-from optimalportfolios.utils.filter_nans import filter_covar_and_vectors_for_nans
+from optimalportfolios.utils.portfolio_funcs import compute_portfolio_risk_contribution_outputs
+from optimalportfolios.utils.filter_nans import filter_covar_and_vectors_for_nans, filter_stacked_covars_for_nans
 from optimalportfolios.optimization.constraints import Constraints
 from pyrb import ConstrainedRiskBudgeting
 
@@ -52,7 +57,8 @@ def rolling_risk_budgeting(prices: pd.DataFrame,
                            risk_budget: pd.Series,
                            covar_dict: Dict[pd.Timestamp, pd.DataFrame],
                            rebalancing_indicators: pd.DataFrame = None,
-                           apply_total_to_good_ratio: bool = True
+                           apply_total_to_good_ratio: bool = True,
+                           use_batch_ccd: bool = True
                            ) -> pd.DataFrame:
     """
     Compute rolling risk-budgeted portfolios at each rebalancing date.
@@ -61,6 +67,12 @@ def rolling_risk_budgeting(prices: pd.DataFrame,
     problem using the pre-computed covariance matrix. The risk budget
     specifies the target fraction of portfolio risk contributed by each asset.
 
+    When the constraints reduce to long-only weight bounds (see
+    ``is_batch_ccd_eligible``) and no rebalancing indicators are given, all
+    dates are first solved in parallel by ``solve_batch_risk_budgeting_ccd``.
+    Dates where the coordinate descent does not converge or violates the
+    weight bounds are re-solved sequentially with ``solve_risk_budgeting_np``.
+
     The covariance matrices are produced externally by any CovarEstimator
     (EwmaCovarEstimator, FactorCovarEstimator, etc.), decoupling the
     estimation step from the optimisation step.
@@ -84,6 +96,8 @@ def rolling_risk_budgeting(prices: pd.DataFrame,
         apply_total_to_good_ratio: If True, rescale risk budgets and constraints
             proportionally when some assets are excluded due to NaN or zero variance.
             This preserves the intended risk allocation across the valid subset.
+        use_batch_ccd: If True, solve eligible problems for all dates in parallel
+            by coordinate descent before falling back to the pyrb solver.
 
     Returns:
         DataFrame of portfolio weights. Index=rebalancing dates from covar_dict,
@@ -93,25 +107,42 @@ def rolling_risk_budgeting(prices: pd.DataFrame,
         rebalancing_dates = list(covar_dict.keys())
         rebalancing_indicators = rebalancing_indicators.reindex(index=rebalancing_dates).fillna(0.0)
 
-    weights = {}
-    weights_0 = None
-    for date, pd_covar in covar_dict.items():
-        if rebalancing_indicators is not None and weights_0 is not None:
-            rebalancing_indicators_t = rebalancing_indicators.loc[date, :]
+    if use_batch_ccd and len(covar_dict) > 0 and rebalancing_indicators is None \
+            and is_batch_ccd_eligible(constraints=constraints):
+        batch_weights, is_solved = solve_batch_risk_budgeting_ccd(covar_dict=covar_dict,
+                                                                  risk_budget=risk_budget,
+                                                                  constraints=constraints)
+    else:
+        batch_weights, is_solved = None, None
+
+    # weights are kept in numpy aligned to risk_budget.index, the DataFrame is built once at the end
+    tickers = risk_budget.index
+    weights = np.zeros((len(covar_dict), len(tickers)))
+    valid_tickers_cache = {}  # constraints updated to valid tickers, reused while the valid set is unchanged
+    for idx, (date, pd_covar) in enumerate(covar_dict.items()):
+        if is_solved is not None and is_solved[idx]:
+            weights[idx] = batch_weights[idx]
         else:
-            rebalancing_indicators_t = None
-        # align covariance to risk budget ordering
-        pd_covar = pd_covar.reindex(index=risk_budget.index).reindex(columns=risk_budget.index)
-        weights_ = wrapper_risk_budgeting(pd_covar=pd_covar,
-                                          constraints=constraints,
-                                          weights_0=weights_0,
-                                          risk_budget=risk_budget,
-                                          rebalancing_indicators=rebalancing_indicators_t,
-                                          apply_total_to_good_ratio=apply_total_to_good_ratio)
-        weights_0 = weights_  # warm-start next period
-        weights[date] = weights_
-    weights = pd.DataFrame.from_dict(weights, orient='index')
-    weights = weights.reindex(columns=prices.columns.to_list())
+            weights_0 = pd.Series(weights[idx - 1], index=tickers) if idx > 0 else None  # warm-start from previous period
+            if rebalancing_indicators is not None and weights_0 is not None:
+                rebalancing_indicators_t = rebalancing_indicators.loc[date, :]
+            else:
+                rebalancing_indicators_t = None
+            # align covariance to risk budget ordering
+            pd_covar = pd_covar.reindex(index=tickers).reindex(columns=tickers)
+            weights[idx], _, _ = solve_risk_budgeting_np(pd_covar=pd_covar,
+                                                         constraints=constraints,
+                                                         weights_0=weights_0,
+                                                         risk_budget=risk_budget,
+                                                         rebalancing_indicators=rebalancing_indicators_t,
+                                                         apply_total_to_good_ratio=apply_total_to_good_ratio,
+                                                         valid_tickers_cache=valid_tickers_cache)
+    # map columns to prices.columns by position instead of reindexing the DataFrame, missing assets are NaN
+    positions = prices.columns.get_indexer(tickers)
+    is_in_prices = positions >= 0
+    weights_out = np.full((len(covar_dict), len(prices.columns)), np.nan)
+    weights_out[:, positions[is_in_prices]] = weights[:, is_in_prices]
+    weights = pd.DataFrame(weights_out, index=list(covar_dict.keys()), columns=prices.columns.to_list())
     return weights
 
 
@@ -142,6 +173,8 @@ def wrapper_risk_budgeting(pd_covar: pd.DataFrame,
     positive risk budget and N_valid is the subset of those with valid
     covariance data) so that the valid assets absorb the full risk allocation.
 
+    This is a pandas-facing shim over ``solve_risk_budgeting_np``.
+
     Args:
         pd_covar: Covariance matrix (N x N) as DataFrame.
         constraints: Portfolio constraints.
@@ -158,6 +191,52 @@ def wrapper_risk_budgeting(pd_covar: pd.DataFrame,
         Portfolio weights as pd.Series (or DataFrame if detailed_output=True),
         aligned to pd_covar.index.
     """
+    weights, clean_covar, risk_budget = solve_risk_budgeting_np(pd_covar=pd_covar,
+                                                                constraints=constraints,
+                                                                weights_0=weights_0,
+                                                                risk_budget=risk_budget,
+                                                                rebalancing_indicators=rebalancing_indicators,
+                                                                apply_total_to_good_ratio=apply_total_to_good_ratio)
+    weights = pd.Series(weights, index=pd_covar.index)
+    if detailed_output and len(clean_covar.columns) > 0:
+        df = compute_portfolio_risk_contribution_outputs(weights=weights, clean_covar=clean_covar, risk_budget=risk_budget)
+    else:
+        df = weights
+    return df
+
+
+def solve_risk_budgeting_np(pd_covar: pd.DataFrame,
+                            constraints: Constraints,
+                            weights_0: pd.Series = None,
+                            risk_budget: Union[pd.Series, Dict[str, float]] = None,
+                            rebalancing_indicators: pd.Series = None,
+                            apply_total_to_good_ratio: bool = True,
+                            valid_tickers_cache: Optional[Dict[Tuple, Constraints]] = None
+                            ) -> Tuple[np.ndarray, pd.DataFrame, Optional[pd.Series]]:
+    """
+    Single-date risk budgeting returning numpy weights for the full universe.
+
+    Implements the filtering of ``wrapper_risk_budgeting`` but scatters the
+    solved weights into a numpy vector aligned to pd_covar.index (zeros for
+    excluded assets), so that rolling drivers avoid creating and reindexing
+    a pd.Series at every rebalancing date.
+
+    Args:
+        pd_covar: Covariance matrix (N x N) as DataFrame.
+        constraints: Portfolio constraints.
+        weights_0: Previous-period weights for warm-start / fallback / freezing.
+        risk_budget: Target risk budgets. Dict or pd.Series. If None, equal risk budgets are used.
+        rebalancing_indicators: Binary series. Assets with value 0 are frozen at weights_0.
+        apply_total_to_good_ratio: If True, rescale budgets for excluded assets.
+        valid_tickers_cache: Optional dict, shared across rebalancing dates, of constraints
+            updated to the valid tickers. The set of valid tickers is typically stable for
+            long stretches of a backtest, so ``update_with_valid_tickers`` is run once per
+            set and only weights_0 is replaced at each date.
+
+    Returns:
+        Tuple of (weights (N,) aligned to pd_covar.index, filtered covariance matrix,
+        rescaled risk budgets of the valid assets or None).
+    """
     # assets with zero risk budgets are excluded from optimisation
     if risk_budget is not None:
         if isinstance(risk_budget, dict):
@@ -179,14 +258,12 @@ def wrapper_risk_budgeting(pd_covar: pd.DataFrame,
     else:
         fixed_weights = None
 
-    # filter covariance for NaN/zero-variance assets
-    vectors = dict(min_weights=constraints.min_weights, max_weights=constraints.max_weights, risk_budget=risk_budget)
-    clean_covar, good_vectors = filter_covar_and_vectors_for_nans(pd_covar=pd_covar, vectors=vectors,
-                                                                  inclusion_indicators=inclusion_indicators)
+    # filter covariance for NaN/zero-variance assets, vectors are aligned to valid tickers below
+    clean_covar, _ = filter_covar_and_vectors_for_nans(pd_covar=pd_covar, inclusion_indicators=inclusion_indicators)
 
     if len(clean_covar.columns) == 0:
         warnings.warn(f"wrapper_risk_budgeting: no valid assets in covariance matrix, returning zero weights")
-        return pd.Series(0.0, index=pd_covar.index)
+        return np.zeros(len(pd_covar.index)), clean_covar, risk_budget
 
     # rescale risk budgets for reduced universe
     # n_eligible counts assets with positive risk budget (before NaN filtering)
@@ -208,32 +285,41 @@ def wrapper_risk_budgeting(pd_covar: pd.DataFrame,
     else:
         risk_budget_np = None
 
-    constraints1 = constraints.update_with_valid_tickers(valid_tickers=clean_covar.columns.to_list(),
-                                                         total_to_good_ratio=total_to_good_ratio,
-                                                         weights_0=weights_0,
-                                                         rebalancing_indicators=None)
+    if valid_tickers_cache is None:
+        constraints1 = constraints.update_with_valid_tickers(valid_tickers=clean_covar.columns.to_list(),
+                                                             total_to_good_ratio=total_to_good_ratio,
+                                                             weights_0=weights_0,
+                                                             rebalancing_indicators=None)
+    else:
+        cache_key = (tuple(clean_covar.columns), total_to_good_ratio)
+        if cache_key not in valid_tickers_cache:
+            valid_tickers_cache[cache_key] = constraints.update_with_valid_tickers(
+                valid_tickers=clean_covar.columns.to_list(),
+                total_to_good_ratio=total_to_good_ratio,
+                weights_0=None,
+                rebalancing_indicators=None)
+        constraints1 = valid_tickers_cache[cache_key]
+        if weights_0 is not None:
+            constraints1 = replace(constraints1, weights_0=weights_0.reindex(index=clean_covar.columns, fill_value=0.0))
 
     weights0 = opt_risk_budgeting(covar=clean_covar.to_numpy(),
                                   constraints=constraints1,
                                   risk_budget=risk_budget_np)
     weights0[np.isinf(weights0)] = 0.0
-    weights = pd.Series(weights0, index=clean_covar.index)
-    weights = weights.reindex(index=pd_covar.index).fillna(0.0)
+    weights = np.zeros(len(pd_covar.index))
+    weights[pd_covar.index.get_indexer(clean_covar.index)] = weights0
 
     # re-integrate frozen assets: rescale solved weights to fill remaining allocation
     if fixed_weights is not None:
+        fixed_weights = fixed_weights.reindex(index=pd_covar.index).fillna(0.0).to_numpy()
+        is_rebalanced = np.isclose(inclusion_indicators.reindex(index=pd_covar.index).fillna(0.0).to_numpy(), 1.0)
         left_allocation = 1.0 - np.nansum(fixed_weights)
         sum_solved = np.nansum(weights)
         if sum_solved > 0.0:
-            weights = weights * left_allocation / np.nansum(weights)
-        weights = weights.where(np.isclose(inclusion_indicators, 1.0), other=fixed_weights)
+            weights = weights * left_allocation / sum_solved
+        weights = np.where(is_rebalanced, weights, fixed_weights)
 
-    if detailed_output:
-        df = compute_portfolio_risk_contribution_outputs(weights=weights, clean_covar=clean_covar, risk_budget=risk_budget)
-    else:
-        df = weights
-
-    return df
+    return weights, clean_covar, risk_budget
 
 
 def opt_risk_budgeting(covar: np.ndarray,
@@ -296,49 +382,98 @@ def opt_risk_budgeting(covar: np.ndarray,
 
 def opt_risk_budgeting_scipy(covar: np.ndarray,
                              constraints: Constraints,
-                             risk_budget: np.ndarray = None
+                             risk_budget: np.ndarray = None,
+                             use_ccd: bool = True,
+                             x0: Optional[np.ndarray] = None,
+                             ftol: float = 1e-8,
+                             maxiter: int = 200,
+                             xtol: Optional[float] = 1e-8,
+                             cvx_solver: Optional[str] = 'ECOS',
+                             problem_cache: Optional[Dict[int, Tuple]] = None
                              ) -> np.ndarray:
     """
-    Risk budgeting via scipy SLSQP (fallback solver, not recommended).
+    Risk budgeting via cyclical coordinate descent with scipy SLSQP fallback.
+
+    When ``use_ccd=True``, first solves the convex Spinu (2013) problem
 
-    Minimises the sum of squared deviations between actual and target
-    risk contributions:
+        min_y  (1/2) y'Σy - Σ_i b_i log(y_i),  w = y / Σ_i y_i
+
+    by cyclical coordinate descent (``rp_ccd``). If the descent does not converge,
+    the equivalent log-barrier problem is solved by ``cvx_risk_budgeting``. If the
+    solution satisfies the scipy bounds and constraints it is returned directly. Otherwise, the sum of
+    squared deviations between actual and target risk contributions is minimised
+    with SLSQP:
 
         min_w  Σ_i (RC_i(w) - b_i * σ_p(w))²
 
-    This formulation is non-convex and sensitive to initialisation. The pyrb
+    The SLSQP formulation is non-convex and sensitive to initialisation. The pyrb
     solver (``opt_risk_budgeting``) is preferred for production use.
 
     Assets with zero risk budget are set to NaN internally to exclude them
-    from the objective without affecting the constraint structure.
+    from the SLSQP objective without affecting the constraint structure.
+
+    Both solvers are warm-started from ``x0`` or, if not given, from
+    ``constraints.weights_0`` (the previous rebalancing solution in rolling
+    backtests). A warm start that does not match the number of assets, has
+    NaNs, or does not have a positive sum is ignored.
 
     Args:
         covar: Covariance matrix (N x N).
         constraints: Portfolio constraints.
         risk_budget: Target risk budgets (N,). If None, equal budgets used.
+        use_ccd: If True, try the coordinate descent solution before SLSQP.
+        x0: Initial weights (N,). Rescaled to sum to 1.
+        ftol: SLSQP function tolerance for convergence.
+        maxiter: Maximum number of SLSQP iterations.
+        xtol: SLSQP is stopped early once the max absolute change of the weights
+            between iterations falls below xtol. None disables the early exit.
+        cvx_solver: CVXPY solver for the log-barrier problem when coordinate descent
+            does not converge. None goes straight to SLSQP.
+        problem_cache: Optional dict of CVXPY problems passed to ``cvx_risk_budgeting``;
+            share it across rebalancing dates so the log-barrier problem is canonicalised once.
 
     Returns:
         Optimal weights (N,). Falls back to weights_0 or zeros if not solved.
     """
     n = covar.shape[0]
-    if constraints.weights_0 is not None:
+    if x0 is None and constraints.weights_0 is not None:
         x0 = constraints.weights_0.to_numpy()
-    elif risk_budget is not None:
-        x0 = risk_budget
-    else:
-        x0 = np.ones(n) / n
+    x0 = normalise_warm_start(x0=x0, n=n)
 
     if risk_budget is None:
         risk_budget = np.ones(n) / n
 
     constraints_, bounds = constraints.set_scipy_constraints(covar=covar)
 
+    # factor Σ = LL' once per call so the objective computes σ² = ||L'w||² >= 0;
+    # a covariance that is only positive semi-definite is used without factorisation
+    try:
+        chol = cholesky(covar, lower=True)
+    except LinAlgError:
+        chol = None
+
+    # the Spinu objective is coercive on the positive orthant for PSD Σ, so coordinate descent needs only Σ_ii > 0
+    if use_ccd and np.all(np.diag(covar) > 0.0):
+        ccd_weights, is_converged = rp_ccd(covar=np.ascontiguousarray(covar, dtype=np.float64),
+                                           budget=np.ascontiguousarray(risk_budget, dtype=np.float64),
+                                           y0=x0)
+        if not is_converged and cvx_solver is not None:
+            ccd_weights = cvx_risk_budgeting(covar=covar, risk_budget=risk_budget, chol=chol,
+                                             problem_cache=problem_cache, solver=cvx_solver)
+            is_converged = ccd_weights is not None
+        if is_converged and is_scipy_feasible(x=ccd_weights, constraints_=constraints_, bounds=bounds):
+            return ccd_weights
+
+    if x0 is None:
+        x0 = risk_budget
+
     # set zero risk budget to NaN to exclude from objective computation
     risk_budget = np.where(np.isclose(risk_budget, 0.0), np.nan, risk_budget)
-    options = {'ftol': 1e-8, 'maxiter': 200}
+    options = {'ftol': ftol, 'maxiter': maxiter}
+    callback = make_weights_change_callback(xtol=xtol) if xtol is not None else None
 
-    res = minimize(risk_budget_objective, x0, args=[covar, risk_budget], method='SLSQP',
-                  constraints=constraints_, bounds=bounds, options=options)
+    res = minimize(risk_budget_objective, x0, args=[covar, risk_budget, chol], method='SLSQP', jac=True,
+                   constraints=constraints_, bounds=bounds, options=options, callback=callback)
 
     optimal_weights = res.x
 
@@ -354,9 +489,331 @@ def opt_risk_budgeting_scipy(covar: np.ndarray,
     return optimal_weights
 
 
-def risk_budget_objective(x, pars) -> float:
+def set_cvx_risk_budgeting_problem(n: int) -> Tuple[cvx.Problem, cvx.Variable, cvx.Parameter, cvx.Parameter]:
+    """
+    Log-barrier formulation of risk budgeting (Maillard et al. 2010):
+
+        min_y  ||L'y||²  s.t.  Σ_i b_i log(y_i) >= 0,  y >= 0,   w = y / Σ_i y_i
+
+    with Σ = LL'. The covariance enters through the Cholesky factor L and the
+    budgets b are parameters, so the problem is DPP and its canonicalisation can
+    be reused across rebalancing dates with the same number of assets.
+
+    Returns:
+        Tuple of (problem, variable y, parameter L (N x N), parameter b (N,)).
+    """
+    y = cvx.Variable(n, nonneg=True)
+    chol = cvx.Parameter((n, n))
+    budget = cvx.Parameter(n, nonneg=True)
+    objective = cvx.Minimize(cvx.sum_squares(chol.T @ y))
+    problem = cvx.Problem(objective, [budget @ cvx.log(y) >= 0.0])
+    return problem, y, chol, budget
+
+
+def cvx_risk_budgeting(covar: np.ndarray,
+                       risk_budget: np.ndarray = None,
+                       chol: Optional[np.ndarray] = None,
+                       problem_cache: Optional[Dict[int, Tuple]] = None,
+                       solver: str = 'ECOS',
+                       verbose: bool = False
+                       ) -> Optional[np.ndarray]:
     """
-    Risk budget deviation objective for scipy minimisation.
+    Long-only risk budgeting by an interior-point solve of the convex log-barrier problem.
+
+    The exponential cone constraint is handled natively by ECOS, which converges
+    in a few tens of iterations to the unique risk budgeting solution. Only
+    long-only, fully invested weights are produced; bounds and group constraints
+    are checked by the caller.
+
+    Args:
+        covar: Covariance matrix (N x N), positive semi-definite.
+        risk_budget: Target risk budgets (N,). If None, equal budgets used.
+        chol: Optional factor L with LL' = covar, e.g. the lower Cholesky factor
+            already computed by the caller. If None, it is computed from covar.
+        problem_cache: Optional dict keyed by N of problems built by
+            ``set_cvx_risk_budgeting_problem``; pass the same dict across
+            rebalancing dates to skip re-canonicalisation.
+        solver: CVXPY solver, must support the exponential cone.
+        verbose: Passed to ``problem.solve``.
+
+    Returns:
+        Weights (N,) summing to 1, or None if the solver fails.
+    """
+    n = covar.shape[0]
+    if risk_budget is None:
+        risk_budget = np.ones(n) / n
+
+    if problem_cache is not None and n in problem_cache:
+        problem, y, chol_par, budget = problem_cache[n]
+    else:
+        problem, y, chol_par, budget = set_cvx_risk_budgeting_problem(n=n)
+        if problem_cache is not None:
+            problem_cache[n] = problem, y, chol_par, budget
+
+    if chol is None:
+        try:
+            chol = cholesky(covar, lower=True)
+        except LinAlgError:
+            # positive semi-definite covariance: factor by eigendecomposition with negative eigenvalues clipped
+            eig_values, eig_vectors = np.linalg.eigh(covar)
+            chol = eig_vectors * np.sqrt(np.maximum(eig_values, 0.0))
+    chol_par.value = chol
+    budget.value = np.maximum(risk_budget, 0.0)
+
+    try:
+        problem.solve(verbose=verbose, solver=solver)
+    except cvx.error.SolverError:
+        warnings.warn(f"cvx_risk_budgeting: {solver} solver failed")
+        return None
+
+    if y.value is None or not np.sum(y.value) > 0.0:
+        warnings.warn(f"cvx_risk_budgeting: problem is {problem.status}")
+        return None
+    optimal_weights = np.maximum(y.value, 0.0)
+    return optimal_weights / np.sum(optimal_weights)
+
+
+@njit(cache=True)
+def rp_ccd(covar: np.ndarray,
+           budget: np.ndarray,
+           tol: float = 1e-10,
+           max_sweeps: int = 50,
+           y0: Optional[np.ndarray] = None
+           ) -> Tuple[np.ndarray, bool]:
+    """
+    Long-only risk budgeting by cyclical coordinate descent on the Spinu (2013) problem.
+
+    Minimises the convex log-barrier objective
+
+        f(y) = (1/2) y'Σy - Σ_i b_i log(y_i)
+
+    whose first-order conditions y_i (Σy)_i = b_i are the risk budgeting equations.
+    The coordinate update solves Σ_ii y_i² + ((Σy)_i - Σ_ii y_i) y_i - b_i = 0 for
+    its positive root, and Σy is updated with a single column instead of a full matvec.
+
+    Args:
+        covar: Covariance matrix (N x N) with positive diagonal, no NaNs.
+        budget: Risk budgets (N,), non-negative. Rescaled to sum to 1.
+        tol: Convergence tolerance on the max absolute coordinate change per sweep.
+        max_sweeps: Maximum number of sweeps over all coordinates.
+        y0: Optional warm start (N,), e.g. the previous rebalancing weights.
+            Must be non-negative with positive variance. If None, inverse-vol
+            weights are used.
+
+    Returns:
+        Tuple of (weights (N,) summing to 1, convergence flag).
+    """
+    n = covar.shape[0]
+    budget = budget / np.sum(budget)
+    if y0 is None:
+        # initialise with inverse-vol weights
+        y = 1.0 / np.sqrt(np.diag(covar))
+    else:
+        y = y0.astype(np.float64)
+    # rescale to y'Σy = 1, which holds at the solution when budgets sum to 1
+    sy = covar @ y
+    scaler = 1.0 / np.sqrt(y @ sy)
+    y = scaler * y
+    sy = scaler * sy
+    is_converged = False
+    for _ in range(max_sweeps):
+        max_change = 0.0
+        for i in range(n):
+            a = covar[i, i]
+            c = sy[i] - a * y[i]
+            y_i = (-c + np.sqrt(c * c + 4.0 * a * budget[i])) / (2.0 * a)
+            dy = y_i - y[i]
+            if dy != 0.0:
+                for j in range(n):  # covar is symmetric: row i equals column i
+                    sy[j] += dy * covar[i, j]
+                y[i] = y_i
+            max_change = max(max_change, np.abs(dy))
+        if max_change < tol:
+            is_converged = True
+            break
+    return y / np.sum(y), is_converged
+
+
+def normalise_warm_start(x0: Optional[np.ndarray], n: int) -> Optional[np.ndarray]:
+    """
+    Validate initial weights and rescale them to sum to 1.
+
+    Args:
+        x0: Candidate initial weights, e.g. previous rebalancing weights
+            reindexed to the current valid assets.
+        n: Number of assets in the current problem.
+
+    Returns:
+        Weights (N,) summing to 1, or None if x0 is None, has the wrong length,
+        contains NaNs, or does not have a positive sum.
+    """
+    if x0 is None:
+        return None
+    x0 = np.asarray(x0, dtype=np.float64)
+    if x0.shape != (n,) or not np.all(np.isfinite(x0)):
+        return None
+    total = np.sum(x0)
+    if total <= 0.0:
+        return None
+    return x0 / total
+
+
+@njit(parallel=True, cache=True)
+def rp_ccd_batch(covars: np.ndarray,
+                 budgets: np.ndarray,
+                 valid: np.ndarray
+                 ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solve independent long-only risk budgeting problems in parallel with ``rp_ccd``.
+
+    Each date t is solved on the sub-matrix of assets flagged in valid[t];
+    the remaining assets receive zero weight.
+
+    Args:
+        covars: Stacked covariance matrices (T x N x N).
+        budgets: Risk budgets per date (T x N).
+        valid: Boolean mask of assets included at each date (T x N).
+
+    Returns:
+        Tuple of (weights (T x N), convergence flags (T,)).
+    """
+    n_dates, n = budgets.shape
+    weights = np.zeros((n_dates, n))
+    is_converged = np.zeros(n_dates, dtype=np.bool_)
+    for t in prange(n_dates):
+        idx = np.flatnonzero(valid[t])
+        k = idx.shape[0]
+        if k == 0:
+            continue
+        sub_covar = np.empty((k, k))
+        for i in range(k):
+            for j in range(k):
+                sub_covar[i, j] = covars[t, idx[i], idx[j]]
+        w, is_converged[t] = rp_ccd(sub_covar, budgets[t][idx])
+        for i in range(k):
+            weights[t, idx[i]] = w[i]
+    return weights, is_converged
+
+
+def is_batch_ccd_eligible(constraints: Constraints) -> bool:
+    """
+    Check whether constraints reduce to long-only weight bounds with full exposure.
+
+    For such constraints the risk budgeting solution is the long-only Spinu
+    solution whenever it satisfies the weight bounds, so it can be computed by
+    ``rp_ccd`` without the pyrb solver.
+
+    Args:
+        constraints: Portfolio constraints.
+
+    Returns:
+        True if the batch coordinate descent solver can be used.
+    """
+    if not constraints.is_long_only or constraints.group_lower_upper_constraints is not None:
+        return False
+    if not (np.isclose(constraints.min_exposure, 1.0) and np.isclose(constraints.max_exposure, 1.0)):
+        return False
+    if constraints.min_weights is not None and np.any(constraints.min_weights.fillna(0.0) > 0.0):
+        return False
+    return True
+
+
+def solve_batch_risk_budgeting_ccd(covar_dict: Dict[pd.Timestamp, pd.DataFrame],
+                                   risk_budget: pd.Series,
+                                   constraints: Constraints,
+                                   variance_floor: float = (0.001) ** 2
+                                   ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solve long-only risk budgeting for all dates of covar_dict in one parallel call.
+
+    Applies the same asset filtering as ``wrapper_risk_budgeting``: assets with
+    NaN variance or zero risk budget get zero weight, and near-zero variances are
+    clamped to ``variance_floor``. A date is flagged as solved only if the
+    coordinate descent converged and the weights satisfy the scipy bounds of
+    ``constraints``; unsolved dates should be re-solved with the pyrb solver.
+
+    Args:
+        covar_dict: Pre-computed covariance matrices keyed by rebalancing date.
+        risk_budget: Target risk budgets per asset. Index=tickers.
+        constraints: Portfolio constraints, must satisfy ``is_batch_ccd_eligible``.
+        variance_floor: Minimum diagonal variance for included assets.
+
+    Returns:
+        Tuple of (weights array (T x N) with rows ordered as covar_dict and columns
+        as risk_budget.index, boolean array flagging the solved dates).
+    """
+    tickers = risk_budget.index
+    covars = np.stack([pd_covar.reindex(index=tickers, columns=tickers).to_numpy(dtype=np.float64)
+                       for pd_covar in covar_dict.values()])
+    budget_np = risk_budget.fillna(0.0).to_numpy(dtype=np.float64)
+    budgets = np.tile(budget_np, (covars.shape[0], 1))
+    covars, valid = filter_stacked_covars_for_nans(covars=covars,
+                                                   inclusion_indicators=np.where(budget_np > 0.0, 1.0, 0.0),
+                                                   variance_floor=variance_floor)
+
+    weights_np, is_converged = rp_ccd_batch(covars, budgets, valid)
+
+    # caps are only loosened by total_to_good_ratio, so checking the unscaled bounds is conservative
+    bounds = constraints.update_with_valid_tickers(valid_tickers=tickers.to_list()).set_scipy_bounds(covar=covars[0])
+    is_solved = is_converged
+    if bounds is not None:
+        is_within_bounds = np.logical_and(np.all(weights_np >= bounds[:, 0] - 1e-8, axis=1),
+                                          np.all(weights_np <= bounds[:, 1] + 1e-8, axis=1))
+        is_solved = np.logical_and(is_solved, is_within_bounds)
+
+    return weights_np, is_solved
+
+
+def make_weights_change_callback(xtol: float) -> Callable[[np.ndarray], None]:
+    """
+    Create an SLSQP callback that stops the iterations once max |w_k - w_{k-1}| < xtol.
+
+    Raising StopIteration makes scipy return the current iterate, which avoids
+    grinding to maxiter on near-degenerate problems where the objective keeps
+    decreasing by amounts irrelevant for the weights.
+    """
+    x_prev = [None]
+
+    def callback(xk: np.ndarray) -> None:
+        if x_prev[0] is not None and np.max(np.abs(xk - x_prev[0])) < xtol:
+            raise StopIteration
+        x_prev[0] = np.copy(xk)
+
+    return callback
+
+
+def is_scipy_feasible(x: np.ndarray,
+                      constraints_: List[Dict],
+                      bounds: np.ndarray = None,
+                      tol: float = 1e-8
+                      ) -> bool:
+    """
+    Check weights against scipy-style bounds and inequality / equality constraints.
+
+    Args:
+        x: Portfolio weights (N,).
+        constraints_: Constraint dicts as produced by ``Constraints.set_scipy_constraints()``.
+        bounds: Array of (min, max) bounds per asset, or None.
+        tol: Feasibility tolerance.
+
+    Returns:
+        True if all bounds and constraints are satisfied within tolerance.
+    """
+    if bounds is not None:
+        if np.any(x < bounds[:, 0] - tol) or np.any(x > bounds[:, 1] + tol):
+            return False
+    for constraint in constraints_:
+        value = np.asarray(constraint['fun'](x))
+        if constraint['type'] == 'ineq' and np.any(value < -tol):
+            return False
+        if constraint['type'] == 'eq' and np.any(np.abs(value) > tol):
+            return False
+    return True
+
+
+def risk_budget_objective(x, pars) -> Tuple[float, np.ndarray]:
+    """
+    Risk budget deviation objective and its gradient for scipy minimisation.
 
     Computes mean squared error between actual risk contributions and
     target budgets:
@@ -366,23 +823,53 @@ def risk_budget_objective(x, pars) -> float:
     where RC_i = w_i (Σw)_i / σ_p is the risk contribution and b_i σ_p
     is the target. Assets with NaN budgets are excluded from the sum.
 
+    Multiplying each deviation by σ_p gives the equivalent form in variance
+    units, which needs no square root:
+
+        f(w) = (1/N) Σ_i e_i² / σ_p²,  e_i = w_i (Σw)_i - b_i σ_p²
+
+    With ∂σ_p²/∂w_k = 2(Σw)_k, the gradient is
+
+        ∂f/∂w_k = (2/(N σ_p²)) [e_k (Σw)_k + (Σ(e∘w))_k - 2 (e'b) (Σw)_k]
+                  - (2/N) (e'e / σ_p⁴) (Σw)_k
+
+    so SLSQP is called with ``jac=True`` instead of finite differences.
+
+    If the lower Cholesky factor L of Σ is given, Σw is computed as L(L'w)
+    and σ_p² = ||L'w||², which is non-negative by construction.
+
     Args:
         x: Portfolio weights (N,).
-        pars: [covar, budget] — covariance matrix and risk budgets.
+        pars: [covar, budget] or [covar, budget, chol] — covariance matrix,
+            risk budgets and optional lower Cholesky factor of covar.
 
     Returns:
-        Mean squared deviation (scalar).
+        Tuple of (mean squared deviation, gradient (N,)).
     """
     covar, budget = pars[0], pars[1]
-    asset_rc = compute_portfolio_risk_contributions(x, covar)
-    sig_p = np.sqrt(compute_portfolio_variance(x, covar))
+    chol = pars[2] if len(pars) > 2 else None
+    n = x.shape[0]
+    if chol is not None:
+        lw = chol.T @ x
+        sw = chol @ lw
+        var_p = lw @ lw
+    else:
+        sw = covar @ x
+        var_p = x @ sw
+    asset_rc = x * sw  # risk contributions scaled by σ_p
     if budget is not None:
         # NaN budgets are preserved: their RC matches itself, contributing 0 to SSE
-        risk_target = np.where(np.isnan(budget), asset_rc, np.multiply(sig_p, budget))
+        is_included = ~np.isnan(budget)
+        budget = np.where(is_included, budget, 0.0)
+        e = np.where(is_included, asset_rc - var_p * budget, 0.0)
     else:
-        risk_target = np.multiply(sig_p, np.ones_like(asset_rc) / asset_rc.shape[0])
-    sse = np.nanmean(np.square(asset_rc - risk_target))
-    return sse
+        budget = np.ones(n) / n
+        e = asset_rc - var_p * budget
+    # e is NaN-free after masking, so the fused dot avoids the square/nanmean temporaries
+    ee = e @ e
+    sse = ee / (n * var_p)
+    grad = (2.0 / (n * var_p)) * (e * sw + covar @ (e * x) - (2.0 * (e @ budget) + ee / var_p) * sw)
+    return sse, grad
 
 
 def solve_for_risk_budgets_from_given_weights(prices: pd.DataFrame,
@@ -12,6 +12,10 @@ from optimalportfolios.optimization.solvers.risk_budgeting import (
     opt_risk_budgeting_scipy,
     wrapper_risk_budgeting,
     rolling_risk_budgeting,
+    rp_ccd,
+    cvx_risk_budgeting,
+)
+from optimalportfolios.utils.portfolio_funcs import (
     compute_portfolio_risk_contributions,
     compute_portfolio_variance,
 )
@@ -23,6 +27,9 @@ class LocalTests(Enum):
     RISK_BUDGETING_WITH_BOUNDS = 2
     WRAPPER_RISK_BUDGETING = 3
     ROLLING_RISK_BUDGETING = 4
+    CCD_VS_PYRB = 5
+    ROLLING_BATCH_CCD_VS_PYRB = 6
+    CVX_VS_CCD = 7
 
 
 def run_local_test(local_test: LocalTests):
@@ -276,6 +283,76 @@ def run_local_test(local_test: LocalTests):
                              title='Risk Budget Portfolios — NAV',
                              ax=axs[2])
 
+    elif local_test == LocalTests.CCD_VS_PYRB:
+        # coordinate descent on the Spinu problem should match pyrb for long-only budgets
+        n = 4
+        vols = np.array([0.20, 0.15, 0.10, 0.25])
+        corr = np.array([[1.0, 0.3, -0.2, 0.5],
+                          [0.3, 1.0, 0.2, 0.4],
+                          [-0.2, 0.2, 1.0, 0.1],
+                          [0.5, 0.4, 0.1, 1.0]])
+        covar = np.outer(vols, vols) * corr
+        risk_budget = np.array([0.50, 0.20, 0.20, 0.10])
+        constraints = Constraints(is_long_only=True)
+
+        w_ccd, is_converged = rp_ccd(covar=covar, budget=risk_budget)
+        w_pyrb = opt_risk_budgeting(covar=covar, constraints=constraints, risk_budget=risk_budget)
+        w_scipy = opt_risk_budgeting_scipy(covar=covar, constraints=constraints, risk_budget=risk_budget)
+        rc_ccd = compute_portfolio_risk_contributions(w_ccd, covar)
+
+        print(f"── CCD vs pyrb ──")
+        print(f"Converged:   {is_converged}")
+        print(f"CCD:         {np.array2string(w_ccd, precision=6)}")
+        print(f"pyrb:        {np.array2string(w_pyrb, precision=6)}")
+        print(f"scipy:       {np.array2string(w_scipy, precision=6)}")
+        print(f"RC (norm):   {np.array2string(rc_ccd / np.nansum(rc_ccd), precision=6)}")
+        print(f"Max abs diff vs pyrb: {np.max(np.abs(w_ccd - w_pyrb)):.2e}")
+
+    elif local_test == LocalTests.ROLLING_BATCH_CCD_VS_PYRB:
+        # parallel coordinate descent over all dates should reproduce the sequential pyrb solutions
+        import qis as qis
+        from optimalportfolios.test_data import load_test_data
+        from optimalportfolios.covar_estimation.ewma_covar_estimator import EwmaCovarEstimator
+
+        prices = load_test_data()
+        prices = prices.loc['2000':, :]
+        tickers = prices.columns.to_list()
+        time_period = qis.TimePeriod(start='31Dec2004', end=prices.index[-1])
+        covar_dict = EwmaCovarEstimator(returns_freq='W-WED', span=52,
+                                        rebalancing_freq='QE').fit_rolling_covars(prices=prices,
+                                                                                  time_period=time_period)
+        equal_budget = pd.Series(1.0 / len(tickers), index=tickers)
+        constraints = Constraints(is_long_only=True,
+                                  min_weights=pd.Series(0.0, index=tickers),
+                                  max_weights=pd.Series(0.5, index=tickers))
+
+        w_batch = rolling_risk_budgeting(prices=prices, constraints=constraints, risk_budget=equal_budget,
+                                         covar_dict=covar_dict, use_batch_ccd=True)
+        w_pyrb = rolling_risk_budgeting(prices=prices, constraints=constraints, risk_budget=equal_budget,
+                                        covar_dict=covar_dict, use_batch_ccd=False)
+        print(f"── Rolling batch CCD vs pyrb ──")
+        print(f"Num dates:            {len(w_batch.index)}")
+        print(f"Max abs weight diff:  {np.nanmax(np.abs(w_batch - w_pyrb).to_numpy()):.2e}")
+
+    elif local_test == LocalTests.CVX_VS_CCD:
+        # interior-point solve of the log-barrier problem should match coordinate descent,
+        # re-solving with a cached problem only updates the parameters
+        vols = np.array([0.20, 0.15, 0.10, 0.25])
+        corr = np.array([[1.0, 0.3, -0.2, 0.5],
+                          [0.3, 1.0, 0.2, 0.4],
+                          [-0.2, 0.2, 1.0, 0.1],
+                          [0.5, 0.4, 0.1, 1.0]])
+        risk_budget = np.array([0.50, 0.20, 0.20, 0.10])
+        problem_cache = {}
+        print(f"── CVXPY (ECOS) vs CCD ──")
+        for scaler in [1.0, 1.5, 0.5]:
+            vols_t = vols * np.array([scaler, 1.0, 1.0, 1.0])  # shock the first asset's vol
+            covar = np.outer(vols_t, vols_t) * corr
+            w_ccd, _ = rp_ccd(covar=covar, budget=risk_budget)
+            w_cvx = cvx_risk_budgeting(covar=covar, risk_budget=risk_budget, problem_cache=problem_cache)
+            print(f"Vol scaler {scaler}: CVX {np.array2string(w_cvx, precision=6)}, "
+                  f"max abs diff vs CCD: {np.max(np.abs(w_cvx - w_ccd)):.2e}")
+
     plt.show()
 
 
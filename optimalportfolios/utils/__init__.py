@@ -1,6 +1,7 @@
 
 from optimalportfolios.utils.filter_nans import (filter_covar_and_vectors,
-                                                 filter_covar_and_vectors_for_nans)
+                                                 filter_covar_and_vectors_for_nans,
+                                                 filter_stacked_covars_for_nans)
 
 from optimalportfolios.utils.portfolio_funcs import (compute_portfolio_vol,
                                                      compute_tre_turnover_stats)
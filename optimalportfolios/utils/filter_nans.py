@@ -92,3 +92,35 @@ def filter_covar_and_vectors_for_nans(pd_covar: pd.DataFrame,
         good_vectors = None
 
     return pd_covar, good_vectors
+
+
+def filter_stacked_covars_for_nans(covars: np.ndarray,
+                                   inclusion_indicators: Optional[np.ndarray] = None,
+                                   variance_floor: float = (0.001) ** 2
+                                   ) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorised version of filter_covar_and_vectors_for_nans for stacked covariance matrices.
+
+    Computes the valid-asset masks of all dates at once on a (T, N, N) array instead of
+    masking one DataFrame per date. Assets with NaN variance are flagged invalid, and
+    near-zero variances of valid assets are clamped to variance_floor, as in
+    filter_covar_and_vectors_for_nans. The clean matrix of date t is
+    ``covars[t][np.ix_(valid[t], valid[t])]``.
+
+    Args:
+        covars: Stacked covariance matrices (T x N x N), all aligned to the same tickers.
+        inclusion_indicators: Optional binary array (N,) or (T x N), 1=include, 0=exclude.
+        variance_floor: Minimum diagonal variance for included assets.
+
+    Returns:
+        Tuple of (copy of covars with clamped diagonals, boolean valid mask (T x N)).
+    """
+    covars = np.array(covars, dtype=np.float64)
+    variances = np.diagonal(covars, axis1=1, axis2=2)
+    valid = ~np.isnan(variances)
+    if inclusion_indicators is not None:
+        valid = np.logical_and(valid, np.isclose(inclusion_indicators, 1.0))
+
+    # increasing diagonal entries preserves positive semi-definiteness
+    diag_idx = np.arange(covars.shape[1])
+    covars[:, diag_idx, diag_idx] = np.where(valid, np.maximum(variances, variance_floor), variances)
+    return covars, valid
@@ -9,15 +9,16 @@ from typing import Tuple, Union, Optional
 from numba import njit
 
 
-@njit
+@njit(cache=True)
 def compute_portfolio_variance(w: np.ndarray, covar: np.ndarray) -> float:
     return w.T @ covar @ w
 
 
-@njit
+@njit(cache=True)
 def compute_portfolio_risk_contributions(w: np.ndarray, covar: np.ndarray) -> np.ndarray:
-    portfolio_vol = np.sqrt(w.T @ covar @ w)
-    marginal_risk_contribution = covar @ w.T
+    # single matvec shared by the marginal contributions and the portfolio vol
+    marginal_risk_contribution = covar @ w
+    portfolio_vol = np.sqrt(w @ marginal_risk_contribution)
     rc = np.multiply(marginal_risk_contribution, w) / portfolio_vol
     return rc
 
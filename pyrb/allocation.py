@@ -72,8 +72,7 @@ class RiskBudgetAllocation:
         x = self.x
         cov = self.cov
         x = tools.to_column_matrix(x)
-        cov = np.matrix(cov)
-        RC = np.multiply(x, cov * x)
+        RC = np.multiply(x, cov @ x)
         return np.sum(tools.to_array(RC))
 
     def get_volatility(self):
@@ -87,7 +86,7 @@ class RiskBudgetAllocation:
         else:
             x = self.x
             x = tools.to_column_matrix(x)
-        return float(x.T * self.pi)
+        return float((x.T @ self.pi).item())
 
     def __str__(self):
         return (
@@ -129,8 +128,7 @@ class EqualRiskContribution(RiskBudgetAllocation):
         x = self.x
         cov = self.cov
         x = tools.to_column_matrix(x)
-        cov = np.matrix(cov)
-        RC = np.multiply(x, cov * x) / self.get_volatility()
+        RC = np.multiply(x, cov @ x) / self.get_volatility()
         if scale:
             RC = RC / RC.sum()
         return tools.to_array(RC)
@@ -164,8 +162,7 @@ class RiskBudgeting(RiskBudgetAllocation):
         x = self.x
         cov = self.cov
         x = tools.to_column_matrix(x)
-        cov = np.matrix(cov)
-        RC = np.multiply(x, cov * x) / self.get_volatility()
+        RC = np.multiply(x, cov @ x) / self.get_volatility()
         if scale:
             RC = RC / RC.sum()
         return tools.to_array(RC)
@@ -205,8 +202,7 @@ class RiskBudgetingWithER(RiskBudgetAllocation):
         x = self.x
         cov = self.cov
         x = tools.to_column_matrix(x)
-        cov = np.matrix(cov)
-        RC = np.multiply(x, cov * x) / self.get_volatility() * self.c - self.x * self.pi
+        RC = np.multiply(x, cov @ x) / self.get_volatility() * self.c - np.multiply(x, self.pi)
         if scale:
             RC = RC / RC.sum()
         return tools.to_array(RC)
@@ -365,13 +361,12 @@ class ConstrainedRiskBudgeting(RiskBudgetingWithER):
         x = self.x
         cov = self.cov
         x = tools.to_column_matrix(x)
-        cov = np.matrix(cov)
 
         if self.solver == "admm_qp":
-            RC = np.multiply(x, cov * x) - self.c * self.x * self.pi
+            RC = np.multiply(x, cov @ x) - self.c * np.multiply(x, self.pi)
         else:
             RC = np.multiply(
-                x, cov * x
+                x, cov @ x
             ).T / self.get_volatility() * self.c - tools.to_array(
                 self.x.T
             ) * tools.to_array(
@@ -4,8 +4,8 @@ import numpy as np
 
 
 def to_column_matrix(x):
-    """Return x as a matrix columns."""
-    x = np.matrix(x)
+    """Return x as a column vector, a 2-d array of shape (n, 1)."""
+    x = np.atleast_2d(np.asarray(x))
     if x.shape[1] != 1:
         x = x.T
     if x.shape[1] == 1: